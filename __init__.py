@@ -6,15 +6,32 @@ models using FiftyOne. The UI is defined in JavaScript while execution
 happens in Python.
 """
 
+import gc
 import os
+import sys
+import glob
+import functools
+import json
+import mmap
+import hashlib
+import time
+import shutil
+import atexit
 import logging
-from datetime import datetime
-from typing import Optional, List
-
-import torch
-import fiftyone as fo
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Optional, List, Dict, Set, Tuple, Union
+
+# Reduce CUDA caching allocator fragmentation; this must be set before torch
+# initializes CUDA
+os.environ.setdefault(
+    "PYTORCH_CUDA_ALLOC_CONF",
+    "expandable_segments:True,max_split_size_mb:512,garbage_collection_threshold:0.8",
+)
+
+# torch, ultralytics and the rest of fiftyone are imported where they are
+# used, so that loading the plugin (e.g. for GetTagCounts) stays cheap
 import fiftyone.operators as foo
-import fiftyone.core.storage as fos
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +41,45 @@ MODEL_ROOT = os.path.join(TRAIN_ROOT, "models")
 DATA_ROOT = os.path.join(TRAIN_ROOT, "data")
 PROJECT_ROOT = os.path.join(TRAIN_ROOT, "projects")
 
+# Persist torch.compile artifacts so that models are not recompiled from
+# scratch in every process
+os.environ.setdefault(
+    "TORCHINDUCTOR_CACHE_DIR", os.path.join(TRAIN_ROOT, "torchinductor")
+)
+
+# Parallel weights download settings
+DOWNLOAD_NUM_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Parallel weights upload settings
+UPLOAD_NUM_WORKERS = 8
+UPLOAD_PART_SIZE = 16 * 1024 * 1024
+
+# Image file extensions that Ultralytics can train on
+IMAGE_EXTENSIONS = {
+    ".bmp", ".dng", ".jpeg", ".jpg", ".mpo", ".png", ".tif", ".tiff", ".webp", ".pfm",
+}
+
+# Maximum total size of cached model weights in MODEL_ROOT
+MODEL_CACHE_MAX_BYTES = int(
+    os.environ.get("YOLO_MODEL_CACHE_MAX_BYTES", 20 * 1024 ** 3)
+)
+
+# Age in seconds after which partial downloads in MODEL_ROOT are assumed to
+# be left over from crashed processes
+MODEL_CACHE_PARTIAL_MAX_AGE = 6 * 60 * 60
+
+# Inference models loaded in this process, keyed by (weights path, device,
+# weights file version, whether the model is compiled), in least to most
+# recently used order
+_MODEL_CACHE: Dict[Tuple[str, str, str, bool], tuple] = {}
+_MODEL_CACHE_MAX_MODELS = 2
+_MODEL_CACHE_LOCK = threading.Lock()
+
+# (weights path, device, weights file version) of models whose TensorRT INT8
+# engine failed to build in this process
+_INT8_ENGINE_FAILURES: Set[Tuple[str, str, str]] = set()
+
 
 def _ensure_directories():
     """Create necessary directories if they don't exist."""
@@ -32,26 +88,112 @@ def _ensure_directories():
         logger.debug(f"Ensured directory exists: {directory}")
 
 
-def _setup_cuda_device(model, target_device_index: int = 0):
+def _select_device(target_device_index: Union[int, List[int], None] = 0):
+    """
+    Select the CUDA device(s) to use.
+
+    A list of indices, or None on a multi-GPU machine, selects multiple GPUs,
+    which are returned as a comma-separated string such as "0,1" that
+    Ultralytics trains on with DistributedDataParallel.
+
+    Args:
+        target_device_index: GPU device index, list of indices, or None to
+            use all GPUs
+
+    Returns:
+        tuple: (device string, device count)
+    """
+    import torch
+
+    cuda_device_count = torch.cuda.device_count()
+
+    if cuda_device_count == 0:
+        return "cpu", cuda_device_count
+
+    if target_device_index is None:
+        target_device_index = list(range(cuda_device_count))
+
+    if isinstance(target_device_index, list):
+        indices = [i for i in target_device_index if 0 <= i < cuda_device_count]
+        if len(indices) > 1:
+            return ",".join(str(i) for i in indices), cuda_device_count
+
+        target_device_index = indices[0] if indices else 0
+
+    if cuda_device_count > 1 and target_device_index < cuda_device_count:
+        return f"cuda:{target_device_index}", cuda_device_count
+
+    return "cuda:0", cuda_device_count
+
+
+@functools.lru_cache(maxsize=None)
+def _init_cuda():
+    """
+    Configure CUDA once per process.
+
+    Allows TF32 tensor cores and cuDNN autotuning for matmuls/convs, and
+    initializes CUDA so that later operator runs in the same process skip it.
+    """
+    import torch
+
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
+    torch.backends.cudnn.benchmark = True
+    torch.set_float32_matmul_precision("high")
+
+    if torch.cuda.is_available():
+        torch.cuda.init()
+
+
+def _supports_half(device: str) -> bool:
+    """
+    Check whether a device has tensor cores for fast FP16 compute.
+
+    Args:
+        device: Device string, e.g. "cuda:0" or "cpu"
+
+    Returns:
+        bool: True if the device is a Volta or newer GPU
+    """
+    import torch
+
+    if not device.startswith("cuda"):
+        return False
+
+    return torch.cuda.get_device_capability(device)[0] >= 7
+
+
+def _setup_cuda_device(
+    model, target_device_index: Union[int, List[int], None] = 0
+):
     """
     Configure CUDA device for the model.
 
+    When multiple GPUs are selected the model is left in place, since
+    Ultralytics moves it onto each DDP worker's device itself.
+
     Args:
         model: YOLO model instance
-        target_device_index: GPU device index to use
+        target_device_index: GPU device index, list of indices, or None to
+            use all GPUs
 
     Returns:
         tuple: (configured model, device count)
     """
-    cuda_device_count = torch.cuda.device_count()
+    device, cuda_device_count = _select_device(target_device_index)
     logger.info(f"Found {cuda_device_count} CUDA device(s)")
 
-    if cuda_device_count > 0:
-        if cuda_device_count > 1 and target_device_index < cuda_device_count:
-            device = f"cuda:{target_device_index}"
-        else:
-            device = "cuda:0"
+    if "," in device:
+        logger.info(f"Using devices {device} with DistributedDataParallel")
+    elif cuda_device_count > 0:
+        import torch
+
         model.to(device)
+        torch.cuda.empty_cache()
+        torch.cuda.reset_peak_memory_stats(device)
+
+        # Leave headroom for other processes sharing the GPU
+        torch.cuda.set_per_process_memory_fraction(0.9, device)
         logger.info(f"Using device: {device}")
     else:
         logger.warning("No CUDA devices found, using CPU")
@@ -59,10 +201,546 @@ def _setup_cuda_device(model, target_device_index: int = 0):
     return model, cuda_device_count
 
 
+def _release_cuda_memory():
+    """Free unreferenced Python objects and return cached GPU memory."""
+    gc.collect()
+
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+        torch.cuda.ipc_collect()
+
+
+def _get_local_file_version(path: str) -> str:
+    """
+    Get an identifier that changes whenever a local file is rewritten.
+
+    Args:
+        path: Local file path
+
+    Returns:
+        str: "<size>.<mtime in ns>"
+    """
+    stat = os.stat(path)
+    return f"{stat.st_size}.{stat.st_mtime_ns}"
+
+
+def _get_cached_model(cache_key: Tuple[str, str, str, bool]) -> Optional[tuple]:
+    """
+    Get a model from the cache, marking it as most recently used.
+
+    Must be called with _MODEL_CACHE_LOCK held.
+    """
+    entry = _MODEL_CACHE.pop(cache_key, None)
+    if entry is not None:
+        _MODEL_CACHE[cache_key] = entry
+
+    return entry
+
+
+def _cache_model(cache_key: Tuple[str, str, str, bool], entry: tuple):
+    """
+    Add a model to the cache, evicting the least recently used models.
+
+    Must be called with _MODEL_CACHE_LOCK held.
+    """
+    evicted = False
+    while len(_MODEL_CACHE) >= _MODEL_CACHE_MAX_MODELS:
+        evicted_key = next(iter(_MODEL_CACHE))
+        del _MODEL_CACHE[evicted_key]
+        logger.info(f"Evicted cached YOLO model for {evicted_key[0]} on {evicted_key[1]}")
+        evicted = True
+
+    if evicted:
+        _release_cuda_memory()
+
+    _MODEL_CACHE[cache_key] = entry
+
+
+def _write_calibration_data(
+    samples, calib_dir: str, names: List[str], num_samples: int = 256
+) -> str:
+    """
+    Write a YOLO dataset of sample images for INT8 calibration.
+
+    Local images are symlinked rather than copied, and no labels are written
+    since calibration only needs activations.
+
+    Args:
+        samples: FiftyOne samples or view to draw images from
+        calib_dir: Directory to write the calibration dataset to
+        names: Class names of the model
+        num_samples: Number of images to use
+
+    Returns:
+        str: Path to the calibration dataset.yaml
+    """
+    import yaml
+    import fiftyone.core.storage as fos
+
+    images_dir = os.path.join(calib_dir, "images", "val")
+    shutil.rmtree(calib_dir, ignore_errors=True)
+    os.makedirs(images_dir)
+
+    filepaths = samples.take(min(num_samples, samples.count())).values("filepath")
+    for idx, filepath in enumerate(filepaths):
+        ext = os.path.splitext(filepath)[1]
+        image_path = os.path.join(images_dir, f"{idx:06d}{ext}")
+        if fos.is_local(filepath):
+            os.symlink(filepath, image_path)
+        else:
+            fos.copy_file(filepath, image_path)
+
+    data_yaml = os.path.join(calib_dir, "dataset.yaml")
+    with open(data_yaml, "w") as f:
+        yaml.safe_dump(
+            {
+                "path": calib_dir,
+                "train": "images/val",
+                "val": "images/val",
+                "names": dict(enumerate(names)),
+            },
+            f,
+        )
+
+    logger.info(f"Wrote {len(filepaths)} calibration images to {calib_dir}")
+    return data_yaml
+
+
+def _build_int8_engine(
+    local_weights_path: str,
+    device: str,
+    calib_samples,
+    calib_dir: str,
+    batch_size: int = 1,
+) -> str:
+    """
+    Build a TensorRT INT8 engine for a model, reusing previously built ones.
+
+    Engines are specific to the GPU architecture and only accept batches up
+    to the batch size they were built for, so both are part of the engine's
+    filename.
+
+    Args:
+        local_weights_path: Local path to model weights
+        device: CUDA device string, e.g. "cuda:0"
+        calib_samples: FiftyOne samples or view used for INT8 calibration
+        calib_dir: Directory to write the calibration dataset to
+        batch_size: Maximum inference batch size the engine must accept
+
+    Returns:
+        str: Local path to the TensorRT engine
+    """
+    import torch
+    import ultralytics
+    from ultralytics import YOLO
+
+    # Older Ultralytics releases ignore int8=True for TensorRT exports and
+    # silently build an FP32 engine
+    ultralytics_version = tuple(int(v) for v in ultralytics.__version__.split(".")[:2])
+    if ultralytics_version < (8, 2):
+        raise RuntimeError(
+            "TensorRT INT8 export requires ultralytics>=8.2, found "
+            f"{ultralytics.__version__}"
+        )
+
+    # Ultralytics infers the model format from suffixes anywhere in the
+    # filename, so the ".pt" extension must not be kept
+    major, minor = torch.cuda.get_device_capability(device)
+    weights_stem = os.path.splitext(local_weights_path)[0]
+    engine_path = f"{weights_stem}.sm{major}{minor}.b{batch_size}.int8.engine"
+    if (
+        os.path.isfile(engine_path)
+        and os.path.getmtime(engine_path) >= os.path.getmtime(local_weights_path)
+    ):
+        return engine_path
+
+    model = YOLO(local_weights_path)
+    calib_yaml = _write_calibration_data(calib_samples, calib_dir, list(model.names.values()))
+
+    logger.info(f"Building TensorRT INT8 engine for {local_weights_path}")
+    exported_path = model.export(
+        format="engine",
+        int8=True,
+        dynamic=True,
+        batch=batch_size,
+        workspace=2,
+        data=calib_yaml,
+        device=device,
+    )
+    if not exported_path:
+        exported_path = weights_stem + ".engine"
+
+    os.replace(exported_path, engine_path)
+    logger.info(f"TensorRT engine saved to {engine_path}")
+    return engine_path
+
+
+def _warmup_model(model, device: str, imgsz: int = 640, batch_size: int = 1):
+    """
+    Run a dummy forward pass through a YOLO model.
+
+    This lets cuDNN benchmark and select its convolution algorithms before
+    real inference starts.
+
+    Args:
+        model: YOLO model instance, already on its device
+        device: CUDA device string, e.g. "cuda:0"
+        imgsz: Image size of the dummy input
+        batch_size: Batch size of the dummy input
+    """
+    import torch
+
+    dtype = torch.half if model.overrides.get("half") else torch.float
+    inner_model = model.model.to(dtype)
+    with torch.no_grad():
+        inner_model(
+            torch.zeros(batch_size, 3, imgsz, imgsz, device=device, dtype=dtype)
+        )
+
+
+def _compile_model(model, device: str, imgsz: int = 640, batch_size: int = 1):
+    """
+    Compile a YOLO model's forward pass with torch.compile.
+
+    The compiled graph fuses Conv-BN-activation sequences and reduces kernel
+    launch overhead. A dummy forward pass triggers compilation up front.
+
+    Args:
+        model: YOLO model instance, already on its device
+        device: CUDA device string, e.g. "cuda:0"
+        imgsz: Image size used for the warmup pass
+        batch_size: Batch size used for the warmup pass
+    """
+    import torch
+
+    torch_version = tuple(int(v) for v in torch.__version__.split(".")[:2])
+    if torch_version < (2, 1):
+        logger.warning(f"torch.compile requires torch>=2.1, found {torch.__version__}")
+        return
+
+    # Compile the bound forward rather than wrapping the module, so that
+    # Ultralytics still sees a DetectionModel with its usual attributes. The
+    # predictor letterboxes images to stride-aligned rectangles and the last
+    # batch is usually smaller, so compile for dynamic shapes rather than
+    # recompiling for every new input shape
+    inner_model = model.model
+    inner_model.forward = torch.compile(
+        inner_model.forward, mode="reduce-overhead", dynamic=True, fullgraph=False
+    )
+
+    logger.info("Compiling model with torch.compile")
+    _warmup_model(model, device, imgsz=imgsz, batch_size=batch_size)
+
+
+def _load_inference_model(
+    local_weights_path: str,
+    target_device_index: int = 0,
+    calib_samples=None,
+    calib_dir: Optional[str] = None,
+    compile_model: bool = False,
+    batch_size: int = 1,
+):
+    """
+    Load a YOLO model for inference, reusing models loaded by earlier calls.
+
+    Models are fused and put in eval mode once, then cached for the lifetime
+    of the process. Do not use this for training, which mutates the weights.
+
+    If calibration samples are provided and a GPU is available, the model is
+    converted to a TensorRT INT8 engine, falling back to the PyTorch model if
+    the conversion fails.
+
+    Args:
+        local_weights_path: Local path to model weights
+        target_device_index: GPU device index to use
+        calib_samples: Optional FiftyOne samples or view used to calibrate
+            an INT8 TensorRT engine
+        calib_dir: Directory to write the calibration dataset to
+        compile_model: Whether to compile PyTorch models with torch.compile
+        batch_size: Inference batch size the model will be run with
+
+    Returns:
+        tuple: (configured model, device count)
+    """
+    from ultralytics import YOLO
+
+    device, cuda_device_count = _select_device(target_device_index)
+
+    with _MODEL_CACHE_LOCK:
+        if calib_samples is not None and cuda_device_count > 0:
+            # Building an engine takes minutes, so don't retry failed builds
+            engine_key = (
+                local_weights_path, device, _get_local_file_version(local_weights_path)
+            )
+            if engine_key in _INT8_ENGINE_FAILURES:
+                logger.warning(
+                    f"Building a TensorRT engine for {local_weights_path} failed "
+                    "previously, using PyTorch model"
+                )
+            else:
+                try:
+                    engine_path = _build_int8_engine(
+                        local_weights_path,
+                        device,
+                        calib_samples,
+                        calib_dir,
+                        batch_size=batch_size,
+                    )
+                except Exception as e:
+                    _INT8_ENGINE_FAILURES.add(engine_key)
+                    logger.warning(
+                        f"Failed to build TensorRT engine, using PyTorch model: {str(e)}"
+                    )
+                else:
+                    cache_key = (
+                        engine_path, device, _get_local_file_version(engine_path), False
+                    )
+                    entry = _get_cached_model(cache_key)
+                    if entry is None:
+                        logger.info(f"Loading TensorRT engine from {engine_path}")
+                        model = YOLO(engine_path)
+                        model.overrides["device"] = device
+                        entry = (model, cuda_device_count)
+                        _cache_model(cache_key, entry)
+
+                    return entry
+
+        # Compiled and uncompiled models are cached separately so that a
+        # compiled model is never handed to a compile=False call
+        compile_model = compile_model and cuda_device_count > 0
+        cache_key = (
+            local_weights_path,
+            device,
+            _get_local_file_version(local_weights_path),
+            compile_model,
+        )
+        entry = _get_cached_model(cache_key)
+        if entry is not None:
+            logger.info(f"Using cached YOLO model for {local_weights_path} on {device}")
+        else:
+            logger.info(f"Loading YOLO model from {local_weights_path}")
+            _init_cuda()
+            model = YOLO(local_weights_path)
+            model, cuda_device_count = _setup_cuda_device(model, target_device_index)
+            model.fuse()
+            model.model.eval()
+            model.overrides["device"] = device
+
+            # The predictor converts the model and its inputs to FP16 when
+            # `half` is set, so configure it through the overrides used by
+            # predict()
+            if _supports_half(device):
+                model.overrides["half"] = True
+                logger.info("Using half precision for inference")
+
+            if compile_model:
+                _compile_model(model, device, batch_size=batch_size)
+            elif cuda_device_count > 0:
+                _warmup_model(model, device, batch_size=batch_size)
+
+            entry = (model, cuda_device_count)
+            _cache_model(cache_key, entry)
+
+        return entry
+
+
+def _select_inference_batch_size(device: str, max_batch_size: int = 64) -> int:
+    """
+    Choose an inference batch size from the available GPU memory.
+
+    Args:
+        device: Device string, e.g. "cuda:0" or "cpu"
+        max_batch_size: Upper bound on the batch size
+
+    Returns:
+        int: Batch size, roughly 4 images per GB of GPU memory
+    """
+    import torch
+
+    if not device.startswith("cuda"):
+        return 1
+
+    vram_gb = torch.cuda.get_device_properties(device).total_memory / 1024 ** 3
+    return max(1, min(max_batch_size, int(vram_gb) * 4))
+
+
+@atexit.register
+def _clear_model_cache():
+    """Release all cached inference models."""
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE.clear()
+
+    _release_cuda_memory()
+
+
+def _download_file_parallel(
+    src_path: str,
+    dst_path: str,
+    part_size: int = DOWNLOAD_CHUNK_SIZE,
+    num_workers: int = DOWNLOAD_NUM_WORKERS,
+):
+    """
+    Download a file, using concurrent ranged reads for cloud storage.
+
+    S3 and GCS sources are downloaded in parts of ``part_size`` bytes by
+    ``num_workers`` threads. Local sources are copied directly. Other
+    sources, or cloud downloads whose client library is not installed or
+    fails, fall back to FiftyOne's storage layer.
+
+    Args:
+        src_path: Source path, e.g. "s3://bucket/key" or "gs://bucket/key"
+        dst_path: Local path to write the file to
+        part_size: Size of each downloaded part in bytes
+        num_workers: Number of concurrent part downloads
+    """
+    import fiftyone.core.storage as fos
+
+    if fos.is_local(src_path):
+        shutil.copyfile(src_path, dst_path)
+        return
+
+    try:
+        if src_path.startswith("s3://"):
+            import boto3
+            from boto3.s3.transfer import TransferConfig
+
+            bucket, key = src_path[len("s3://"):].split("/", 1)
+            config = TransferConfig(
+                multipart_threshold=part_size,
+                multipart_chunksize=part_size,
+                max_concurrency=num_workers,
+            )
+            boto3.client("s3").download_file(bucket, key, dst_path, Config=config)
+            return
+
+        if src_path.startswith("gs://"):
+            from google.cloud import storage
+            from google.cloud.storage import transfer_manager
+
+            bucket, key = src_path[len("gs://"):].split("/", 1)
+            blob = storage.Client().bucket(bucket).get_blob(key)
+            if blob is None:
+                raise FileNotFoundError(src_path)
+
+            transfer_manager.download_chunks_concurrently(
+                blob, dst_path, chunk_size=part_size, max_workers=num_workers
+            )
+            return
+    except Exception as e:
+        logger.warning(
+            f"Parallel download of {src_path} failed, falling back to a single "
+            f"stream: {str(e)}"
+        )
+
+    fos.copy_file(src_path, dst_path)
+
+
+def _warm_page_cache(path: str):
+    """
+    Populate the page cache with a file's contents so later reads hit memory.
+
+    Args:
+        path: Local file path
+    """
+    populate = getattr(mmap, "MAP_POPULATE", None)
+    if populate is None or os.path.getsize(path) == 0:
+        return
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        with mmap.mmap(fd, 0, flags=mmap.MAP_SHARED | populate, prot=mmap.PROT_READ):
+            pass
+    finally:
+        os.close(fd)
+
+
+def _get_file_version(path: str) -> Optional[tuple]:
+    """
+    Get the size and version identifier of a file.
+
+    Args:
+        path: Remote or local file path
+
+    Returns:
+        tuple: (size, version) where version is an etag or mtime, or None if
+        the file's metadata is not available
+    """
+    import fiftyone.core.storage as fos
+
+    if fos.is_local(path):
+        stat = os.stat(path)
+        return stat.st_size, str(stat.st_mtime_ns)
+
+    get_file_metadata = getattr(fos, "get_file_metadata", None)
+    if get_file_metadata is None:
+        return None
+
+    try:
+        metadata = get_file_metadata(path)
+    except Exception as e:
+        logger.debug(f"Failed to get metadata for {path}: {str(e)}")
+        return None
+
+    size = metadata.get("size")
+    version = metadata.get("etag") or metadata.get("last_modified")
+    if size is None or version is None:
+        return None
+
+    return int(size), "".join(c for c in str(version) if c.isalnum())
+
+
+def _evict_model_cache(keep_path: str, max_bytes: int = MODEL_CACHE_MAX_BYTES):
+    """
+    Delete least recently used files in MODEL_ROOT until it fits the budget.
+
+    Partial downloads older than MODEL_CACHE_PARTIAL_MAX_AGE are deleted too,
+    while newer ones may belong to running downloads and are left alone.
+
+    Args:
+        keep_path: Path that should never be evicted
+        max_bytes: Maximum total size of MODEL_ROOT in bytes
+    """
+    entries = []
+    for entry in os.scandir(MODEL_ROOT):
+        if not entry.is_file():
+            continue
+
+        stat = entry.stat()
+        if not entry.name.endswith(".partial"):
+            entries.append((stat.st_atime, stat.st_size, entry.path))
+        elif time.time() - stat.st_mtime > MODEL_CACHE_PARTIAL_MAX_AGE:
+            try:
+                os.remove(entry.path)
+                logger.info(f"Deleted stale partial download: {entry.path}")
+            except OSError as e:
+                logger.warning(f"Failed to delete partial download {entry.path}: {str(e)}")
+
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_bytes <= max_bytes:
+            break
+
+        if path == keep_path:
+            continue
+
+        try:
+            os.remove(path)
+            total_bytes -= size
+            logger.info(f"Evicted cached model weights: {path}")
+        except OSError as e:
+            logger.warning(f"Failed to evict cached model weights {path}: {str(e)}")
+
+
 def _download_model_weights(weights_path: str) -> str:
     """
     Download model weights to local directory.
 
+    Downloads are cached by source size and etag/mtime, so repeated calls for
+    an unchanged file reuse the existing local copy. S3 and GCS sources are
+    downloaded in concurrent byte ranges. The local copy is then loaded into the page cache so that model
+    loading does not wait on disk.
+
     Args:
         weights_path: Remote or local path to model weights
 
@@ -70,51 +748,578 @@ def _download_model_weights(weights_path: str) -> str:
         str: Local path to downloaded weights
     """
     _ensure_directories()
-    local_weights_path = os.path.join(MODEL_ROOT, os.path.basename(weights_path))
-    fos.copy_file(weights_path, local_weights_path)
+
+    stem, ext = os.path.splitext(os.path.basename(weights_path))
+    file_version = _get_file_version(weights_path)
+    if file_version is not None:
+        size, version = file_version
+        local_weights_path = os.path.join(MODEL_ROOT, f"{stem}.{size}.{version}{ext}")
+        if os.path.isfile(local_weights_path) and os.path.getsize(local_weights_path) == size:
+            # Only update the access time, which the LRU eviction uses; the
+            # mtime identifies this copy in the in-memory model cache
+            os.utime(
+                local_weights_path,
+                ns=(time.time_ns(), os.stat(local_weights_path).st_mtime_ns),
+            )
+            _warm_page_cache(local_weights_path)
+            logger.info(f"Using cached model weights: {local_weights_path}")
+            return local_weights_path
+    else:
+        local_weights_path = os.path.join(MODEL_ROOT, stem + ext)
+
+    partial_path = f"{local_weights_path}.{os.getpid()}.partial"
+    try:
+        _download_file_parallel(weights_path, partial_path)
+        os.replace(partial_path, local_weights_path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+    _evict_model_cache(local_weights_path)
+    _warm_page_cache(local_weights_path)
     logger.info(f"Model weights downloaded to: {local_weights_path}")
     return local_weights_path
 
 
+def _upload_file_parallel(
+    src_path: str,
+    dst_path: str,
+    part_size: int = UPLOAD_PART_SIZE,
+    num_workers: int = UPLOAD_NUM_WORKERS,
+):
+    """
+    Upload a local file, using concurrent multipart uploads for cloud storage.
+
+    S3 and GCS destinations are uploaded in parts of ``part_size`` bytes by
+    ``num_workers`` threads. Other destinations, or cloud uploads whose client
+    library is not installed or fails, fall back to FiftyOne's storage layer.
+
+    Args:
+        src_path: Local path of the file to upload
+        dst_path: Destination path, e.g. "s3://bucket/key" or "gs://bucket/key"
+        part_size: Size of each uploaded part in bytes
+        num_workers: Number of concurrent part uploads
+    """
+    import fiftyone.core.storage as fos
+
+    try:
+        if dst_path.startswith("s3://"):
+            import boto3
+            from boto3.s3.transfer import TransferConfig
+
+            bucket, key = dst_path[len("s3://"):].split("/", 1)
+            config = TransferConfig(
+                multipart_threshold=8 * 1024 * 1024,
+                multipart_chunksize=part_size,
+                max_concurrency=num_workers,
+            )
+            boto3.client("s3").upload_file(src_path, bucket, key, Config=config)
+            return
+
+        if dst_path.startswith("gs://"):
+            from google.cloud import storage
+            from google.cloud.storage import transfer_manager
+
+            bucket, key = dst_path[len("gs://"):].split("/", 1)
+            blob = storage.Client().bucket(bucket).blob(key)
+            transfer_manager.upload_chunks_concurrently(
+                src_path, blob, chunk_size=part_size, max_workers=num_workers
+            )
+            return
+    except Exception as e:
+        logger.warning(
+            f"Parallel upload to {dst_path} failed, falling back to a single "
+            f"stream: {str(e)}"
+        )
+
+    fos.copy_file(src_path, dst_path)
+
+
 def export_yolo_data(
     samples,
     export_dir: str,
     classes: List[str],
     label_field: str = "ground_truth",
-    split: Optional[str] = None,
+    split: Optional[Union[str, List[str]]] = None,
+    export_media=True,
+    media_paths: Optional[Dict[str, str]] = None,
 ):
     """
     Export FiftyOne samples to YOLOv5 dataset format.
 
+    Each split is exported by its own exporter, since FiftyOne's YOLOv5
+    exporter handles one split at a time. Only the label field is loaded
+    from the database.
+
     Args:
         samples: FiftyOne samples or view to export
         export_dir: Directory where dataset will be exported
         classes: List of class names
         label_field: Name of the label field containing detections
         split: Split name ('train', 'val', etc.) or list of splits
+        export_media: How to export media, e.g. True to copy images or
+            "symlink" to link to the original files
+        media_paths: Optional mapping of sample filepaths to local copies of
+            the media, e.g. from _download_media(), which are exported
+            instead of the original files
     """
-    if isinstance(split, list):
-        # Recursively export each split
-        for split_name in split:
-            export_yolo_data(samples, export_dir, classes, label_field, split_name)
-        return
+    import fiftyone as fo
+    import fiftyone.utils.yolo as fouy
+
+    samples = samples.select_fields(label_field)
 
-    # Determine split view
     if split is None:
-        split_view = samples
-        split = "val"
+        splits = ["val"]
+    else:
+        splits = split if isinstance(split, list) else [split]
+
+    for split_name in splits:
+        split_view = samples.match_tags(split_name) if split is not None else samples
+
+        # The YOLOv5 exporter writes one split per call and merges it into
+        # the existing dataset.yaml
+        if media_paths is None:
+            split_view.export(
+                export_dir=export_dir,
+                dataset_type=fo.types.YOLOv5Dataset,
+                label_field=label_field,
+                classes=classes,
+                split=split_name,
+                export_media=export_media,
+            )
+        else:
+            filepaths, labels = split_view.values(["filepath", label_field])
+            exporter = fouy.YOLOv5DatasetExporter(
+                export_dir=export_dir,
+                split=split_name,
+                classes=classes,
+                export_media=export_media,
+            )
+            with exporter:
+                exporter.log_collection(split_view)
+                for filepath, label in zip(filepaths, labels):
+                    exporter.export_sample(media_paths[filepath], label)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Exported {split_view.count()} samples for split '{split_name}'")
+
+
+def _download_media(
+    filepaths: List[str], media_dir: str, num_workers: int = DOWNLOAD_NUM_WORKERS
+) -> Dict[str, str]:
+    """
+    Download non-local media files in parallel into a local directory.
+
+    Files downloaded by a previous call are reused, and local files are
+    mapped to themselves.
+
+    Args:
+        filepaths: Local or remote media paths
+        media_dir: Directory to download remote media to
+        num_workers: Number of concurrent downloads
+
+    Returns:
+        dict: Mapping of each filepath to a local path
+    """
+    import fiftyone.core.storage as fos
+
+    os.makedirs(media_dir, exist_ok=True)
+
+    media_paths = {}
+    downloads = []
+    for filepath in set(filepaths):
+        if fos.is_local(filepath):
+            media_paths[filepath] = filepath
+            continue
+
+        name = hashlib.sha1(filepath.encode()).hexdigest()[:16]
+        local_path = os.path.join(media_dir, name + os.path.splitext(filepath)[1])
+        media_paths[filepath] = local_path
+        if not os.path.isfile(local_path):
+            downloads.append((filepath, local_path))
+
+    def _download(filepath, local_path):
+        partial_path = f"{local_path}.{os.getpid()}.{threading.get_ident()}.partial"
+        try:
+            fos.copy_file(filepath, partial_path)
+            os.replace(partial_path, local_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+    logger.info(f"Downloading {len(downloads)} media files to {media_dir}")
+    with ThreadPoolExecutor(max_workers=max(1, num_workers)) as pool:
+        futures = [pool.submit(_download, *download) for download in downloads]
+        for future in futures:
+            future.result()
+
+    return media_paths
+
+
+def _get_export_key(
+    dataset, classes: List[str], label_field: str, splits: List[str]
+) -> str:
+    """
+    Compute a key identifying a YOLO export of a dataset's current contents.
+
+    The key changes whenever the export configuration changes or samples are
+    added, deleted, or edited.
+
+    Args:
+        dataset: FiftyOne dataset
+        classes: List of class names
+        label_field: Name of the label field containing detections
+        splits: List of split tags
+
+    Returns:
+        str: Export key
+    """
+    fingerprint = json.dumps(
+        [
+            dataset.name,
+            classes,
+            label_field,
+            splits,
+            dataset.count(),
+            str(dataset.max("last_modified_at")),
+        ]
+    )
+    return hashlib.sha1(fingerprint.encode()).hexdigest()[:16]
+
+
+def _export_training_data(
+    dataset, export_dir: str, classes: List[str], label_field: str, splits: List[str]
+):
+    """
+    Export a dataset for training, unless an export already exists.
+
+    The export is built in a private temporary directory and renamed into
+    place, so concurrent runs never see or modify a partial export. Images are
+    symlinked; non-local media is first downloaded in parallel to a local
+    directory that is shared by all exports of the dataset.
+
+    Args:
+        dataset: FiftyOne dataset
+        export_dir: Directory where the dataset will be exported
+        classes: List of class names
+        label_field: Name of the label field containing detections
+        splits: List of split tags
+    """
+    import yaml
+    import fiftyone.core.storage as fos
+
+    if os.path.isfile(os.path.join(export_dir, "dataset.yaml")):
+        logger.info(f"Reusing existing export in: {export_dir}")
+        return
+
+    filepaths = dataset.values("filepath")
+    if all(fos.is_local(f) for f in filepaths):
+        media_paths = None
     else:
-        split_view = samples.match_tags(split)
-
-    # Export to YOLO format
-    split_view.export(
-        export_dir=export_dir,
-        dataset_type=fo.types.YOLOv5Dataset,
-        label_field=label_field,
-        classes=classes,
-        split=split,
+        media_dir = os.path.join(DATA_ROOT, dataset.name, "media")
+        media_paths = _download_media(filepaths, media_dir)
+
+    logger.info(f"Exporting dataset to: {export_dir}")
+    tmp_dir = f"{export_dir}.{os.getpid()}.partial"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(os.path.dirname(export_dir), exist_ok=True)
+
+    try:
+        export_yolo_data(
+            dataset,
+            tmp_dir,
+            classes=classes,
+            label_field=label_field,
+            split=splits,
+            export_media="symlink",
+            media_paths=media_paths,
+        )
+
+        # Point dataset.yaml at the final location
+        tmp_yaml = os.path.join(tmp_dir, "dataset.yaml")
+        with open(tmp_yaml) as f:
+            data = yaml.safe_load(f)
+
+        data["path"] = export_dir
+        with open(tmp_yaml, "w") as f:
+            yaml.safe_dump(data, f)
+
+        try:
+            os.rename(tmp_dir, export_dir)
+        except OSError:
+            # Another run finished the same export first
+            logger.info(f"Reusing concurrently created export in: {export_dir}")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _select_train_cache(
+    export_dir: str, imgsz: int = 640, num_devices: int = 1
+) -> str:
+    """
+    Choose where Ultralytics should cache decoded training images.
+
+    Images are cached in RAM when the decoded dataset fits in half of the
+    available host memory, otherwise on disk next to the exported images.
+    In multi-GPU training every process caches its own copy of the dataset.
+
+    Args:
+        export_dir: Directory containing the exported YOLO dataset
+        imgsz: Training image size
+        num_devices: Number of GPUs, i.e. training processes
+
+    Returns:
+        str: "ram" or "disk"
+    """
+    import psutil
+
+    # Skip the .npy files that cache="disk" writes next to the images
+    num_images = sum(
+        1
+        for path in glob.glob(os.path.join(export_dir, "images", "*", "*"))
+        if os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS
+    )
+    cache_bytes = num_images * imgsz * imgsz * 3 * num_devices
+    available_bytes = psutil.virtual_memory().available
+    cache = "ram" if available_bytes > 2 * cache_bytes else "disk"
+
+    logger.info(
+        f"Caching {num_images} images on {num_devices} device(s) in {cache} "
+        f"(~{cache_bytes / 1024 ** 3:.1f} GB decoded, "
+        f"{available_bytes / 1024 ** 3:.1f} GB RAM available)"
+    )
+    return cache
+
+
+def _load_train_model(weights_path: str, devices: Union[int, List[int], None]):
+    """
+    Download model weights and load a YOLO model for training.
+
+    Args:
+        weights_path: Remote or local path to model weights
+        devices: GPU device index, list of indices, or None to use all GPUs
+
+    Returns:
+        tuple: (configured model, device count)
+    """
+    from ultralytics import YOLO
+
+    local_weights_path = _download_model_weights(weights_path)
+
+    logger.info(f"Loading YOLO model from {local_weights_path}")
+    _init_cuda()
+    model = YOLO(local_weights_path)
+    return _setup_cuda_device(model, devices)
+
+
+def _checkpointed_forward(forward, x):
+    """Run a module's forward pass with activation checkpointing."""
+    import torch
+    from torch.utils.checkpoint import checkpoint
+
+    if torch.is_grad_enabled():
+        return checkpoint(forward, x, use_reentrant=False)
+
+    return forward(x)
+
+
+def _iter_checkpoint_blocks(model):
+    """Yield the C2f/C3k2 blocks in the backbone of a DetectionModel."""
+    num_backbone_layers = len(model.yaml["backbone"])
+    for layer in model.model[:num_backbone_layers]:
+        for module in layer.modules():
+            if type(module).__name__ in ("C2f", "C3k2"):
+                yield module
+
+
+def _enable_gradient_checkpointing(trainer):
+    """
+    Ultralytics callback that checkpoints the backbone's C2f/C3k2 blocks.
+
+    Activations of these blocks are recomputed during the backward pass
+    instead of being stored, which allows larger batches.
+    """
+    for module in _iter_checkpoint_blocks(trainer.model):
+        if "forward" not in module.__dict__:
+            module.forward = functools.partial(_checkpointed_forward, module.forward)
+
+
+def _disable_gradient_checkpointing(trainer):
+    """
+    Ultralytics callback that undoes _enable_gradient_checkpointing().
+
+    This must run before checkpoints are saved so that the saved model and
+    its EMA copy do not reference this plugin.
+    """
+    models = [trainer.model]
+    if getattr(trainer, "ema", None) is not None:
+        models.append(trainer.ema.ema)
+
+    for model in models:
+        for module in _iter_checkpoint_blocks(model):
+            module.__dict__.pop("forward", None)
+
+
+def _install_gradient_checkpointing(trainer):
+    """
+    Ultralytics callback that enables checkpointing as soon as the trainer
+    builds its model.
+
+    The trainer builds its model and runs AutoBatch in the same setup step,
+    so wrapping its setup_model() lets AutoBatch size the batch for the
+    checkpointed model.
+    """
+    setup_model = trainer.setup_model
+
+    def _setup_model():
+        ckpt = setup_model()
+        _enable_gradient_checkpointing(trainer)
+        return ckpt
+
+    trainer.setup_model = _setup_model
+
+
+def _to_detections(result):
+    """
+    Convert an Ultralytics detection result to FiftyOne detections.
+
+    Args:
+        result: Ultralytics Results instance for one image
+
+    Returns:
+        fo.Detections: Detections in relative [x, y, w, h] coordinates
+    """
+    import fiftyone as fo
+
+    boxes = result.boxes
+    if len(boxes) == 0:
+        return fo.Detections()
+
+    # Convert all boxes from center to top-left coordinates at once
+    bboxes = boxes.xywhn.cpu().numpy()
+    bboxes[:, :2] -= bboxes[:, 2:] / 2
+    confidences = boxes.conf.cpu().numpy()
+    class_ids = boxes.cls.cpu().numpy().astype(int)
+
+    return fo.Detections(
+        detections=[
+            fo.Detection(
+                label=result.names[class_id],
+                bounding_box=bbox.tolist(),
+                confidence=float(confidence),
+            )
+            for bbox, confidence, class_id in zip(bboxes, confidences, class_ids)
+        ]
     )
-    logger.info(f"Exported {len(split_view)} samples for split '{split}'")
+
+
+def _read_image(filepath: str):
+    """
+    Read an image as a BGR array, as expected by Ultralytics.
+
+    Remote media is read through FiftyOne's storage layer.
+
+    Args:
+        filepath: Local or remote image path
+
+    Returns:
+        numpy.ndarray: The image, or None if it could not be read
+    """
+    import cv2
+    import numpy as np
+    import fiftyone.core.storage as fos
+
+    if fos.is_local(filepath):
+        return cv2.imread(filepath)
+
+    try:
+        with fos.open_file(filepath, "rb") as f:
+            data = np.frombuffer(f.read(), dtype=np.uint8)
+    except Exception as e:
+        logger.debug(f"Failed to read {filepath}: {str(e)}")
+        return None
+
+    return cv2.imdecode(data, cv2.IMREAD_COLOR)
+
+
+def _apply_model_batched(
+    model,
+    samples,
+    label_field: str,
+    batch_size: int,
+    num_workers: int,
+    write_batch_size: int = 1000,
+    ctx=None,
+):
+    """
+    Run a YOLO model on samples and store its predictions in batches.
+
+    Images for the next batch are decoded by a thread pool while the current
+    batch is on the GPU, and predictions are written to the database every
+    ``write_batch_size`` samples rather than one sample at a time. Samples
+    whose images cannot be read are skipped, leaving their field unchanged.
+
+    Collections that do not contain images, e.g. videos, are passed to
+    FiftyOne's apply_model() instead.
+
+    Args:
+        model: YOLO model instance
+        samples: FiftyOne samples or view to run inference on
+        label_field: Name of the field in which to store predictions
+        batch_size: Number of images per inference batch
+        num_workers: Number of threads used to decode images
+        write_batch_size: Number of predictions per database write
+        ctx: Optional operator execution context to report progress to
+    """
+    if samples.media_type != "image":
+        logger.info(f"Applying model to {samples.media_type} samples with apply_model()")
+        samples.apply_model(model, label_field=label_field)
+        return
+
+    sample_ids, filepaths = samples.values(["id", "filepath"])
+    num_samples = len(sample_ids)
+
+    decode_pool = ThreadPoolExecutor(max_workers=max(1, num_workers))
+    prefetch_pool = ThreadPoolExecutor(max_workers=1)
+
+    def _load_batch(start):
+        return list(decode_pool.map(_read_image, filepaths[start:start + batch_size]))
+
+    values = {}
+    try:
+        next_batch = prefetch_pool.submit(_load_batch, 0)
+        for start in range(0, num_samples, batch_size):
+            images = next_batch.result()
+            if start + batch_size < num_samples:
+                next_batch = prefetch_pool.submit(_load_batch, start + batch_size)
+
+            batch_ids = sample_ids[start:start + batch_size]
+            valid = [(i, img) for i, img in zip(batch_ids, images) if img is not None]
+            for sample_id, img in zip(batch_ids, images):
+                if img is None:
+                    logger.warning(f"Failed to read image for sample {sample_id}, skipping")
+
+            if valid:
+                results = model.predict([img for _, img in valid], verbose=False)
+                for (sample_id, _), result in zip(valid, results):
+                    values[sample_id] = _to_detections(result)
+
+            if len(values) >= write_batch_size:
+                samples.set_values(label_field, values, key_field="id")
+                values = {}
+
+            if ctx is not None:
+                num_done = min(start + batch_size, num_samples)
+                ctx.set_progress(
+                    progress=num_done / num_samples,
+                    label=f"Processed {num_done}/{num_samples} samples",
+                )
+
+        if values:
+            samples.set_values(label_field, values, key_field="id")
+    finally:
+        prefetch_pool.shutdown()
+        decode_pool.shutdown()
 
 
 class ModelFineTuner(foo.Operator):
@@ -137,7 +1342,7 @@ class ModelFineTuner(foo.Operator):
         Execute model training.
 
         Steps:
-        1. Download model weights to local directory
+        1. Download and load model weights (in the background)
         2. Export dataset to YOLO format
         3. Train YOLOv8 model
         4. Save trained weights to specified location
@@ -145,75 +1350,123 @@ class ModelFineTuner(foo.Operator):
         Returns:
             dict: Training results including weights path and status
         """
-        try:
-            from ultralytics import YOLO
+        import fiftyone.core.storage as fos
 
+        try:
             # Parse parameters
             det_field = ctx.params["det_field"]
             weights_path = ctx.params["weights_path"]
             export_uri = ctx.params["export_uri"]
             epochs = ctx.params["epochs"]
             target_device_index = ctx.params.get("target_device_index", 0)
+            devices = ctx.params.get("devices", target_device_index)
+            batch = ctx.params.get("batch", -1)
+            workers = ctx.params.get("workers", min(os.cpu_count() or 1, 8))
+            cache = ctx.params.get("cache", None)
+            grad_checkpoint = ctx.params.get("grad_checkpoint", False)
 
             logger.info(f"Starting model training with parameters: det_field={det_field}, "
-                       f"epochs={epochs}, device_index={target_device_index}")
+                       f"epochs={epochs}, devices={devices}, "
+                       f"batch={batch}, workers={workers}")
             logger.info(f"Weights path: {weights_path}")
             logger.info(f"Export URI: {export_uri}")
 
             dataset = ctx.dataset
-            logger.info(f"Training on dataset: {dataset.name} ({len(dataset)} samples)")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Training on dataset: {dataset.name} ({dataset.count()} samples)")
 
+            # Download and load the model while the classes are computed and
+            # the dataset is exported
+            pool = ThreadPoolExecutor(max_workers=2)
+            model_future = pool.submit(_load_train_model, weights_path, devices)
             det_label_field = f"{det_field}.detections.label"
-            classes = dataset.distinct(det_label_field)
-            logger.info(f"Found {len(classes)} classes: {classes}")
+            classes_future = pool.submit(dataset.distinct, det_label_field)
+            pool.shutdown(wait=False)
         except Exception as e:
             logger.error(f"Failed to initialize training: {str(e)}", exc_info=True)
             raise
 
-        # Download model weights
-        local_weights_path = _download_model_weights(weights_path)
-
-        # Prepare export directory
-        dataset_root = os.path.join(DATA_ROOT, dataset.name)
-        timestamp = datetime.now().strftime("%Y%m%dT%H%M%S")
-        export_dir = os.path.join(dataset_root, timestamp)
-        logger.info(f"Exporting dataset to: {export_dir}")
-
-        # Export dataset to YOLO format
-        export_yolo_data(
-            ctx.dataset,
-            export_dir,
-            classes=classes,
-            label_field=det_field,
-            split=["train", "val"],
-        )
-
-        # Verify dataset.yaml exists
-        data_yaml = os.path.join(export_dir, "dataset.yaml")
-        if not fos.exists(data_yaml):
-            raise FileNotFoundError(f"Failed to export dataset to {data_yaml}")
-
-        ctx.set_progress(progress=0.1, label="Dataset exported. Starting training...")
-        logger.info("Starting training")
-
-        # Initialize and configure model
-        logger.info(f"Loading YOLO model from {local_weights_path}")
-        model = YOLO(local_weights_path)
-        model, cuda_device_count = _setup_cuda_device(model, target_device_index)
-
-        # Train model
-        logger.info(f"Starting training for {epochs} epochs with image size 640")
-        results = model.train(
-            data=data_yaml,
-            epochs=epochs,
-            imgsz=640,
-            name="finetuned",
-            project=PROJECT_ROOT,
-            exist_ok=True,
-        )
-
-        best_weights = os.path.join(results.save_dir, "weights", "best.pt")
-        logger.info(f"Training complete. Best weights saved to {best_weights}")
+        model = None
+        try:
+            try:
+                classes = classes_future.result()
+                logger.info(f"Found {len(classes)} classes: {classes}")
+            except Exception as e:
+                logger.error(f"Failed to initialize training: {str(e)}", exc_info=True)
+                raise
+
+            # Report bad weights before spending time on the export
+            if model_future.done() and model_future.exception() is not None:
+                raise model_future.exception()
+
+            # Export dataset to YOLO format, reusing a previous export if the
+            # dataset has not changed since
+            splits = ["train", "val"]
+            export_key = _get_export_key(dataset, classes, det_field, splits)
+            export_dir = os.path.join(DATA_ROOT, dataset.name, export_key)
+            _export_training_data(dataset, export_dir, classes, det_field, splits)
+
+            # Verify dataset.yaml exists
+            data_yaml = os.path.join(export_dir, "dataset.yaml")
+            if not fos.exists(data_yaml):
+                raise FileNotFoundError(f"Failed to export dataset to {data_yaml}")
+
+            ctx.set_progress(progress=0.1, label="Dataset exported. Starting training...")
+            logger.info("Starting training")
+
+            # Wait for the model that was loaded during export
+            model, cuda_device_count = model_future.result()
+            device, _ = _select_device(devices)
+
+            # AutoBatch only supports single-GPU training
+            if "," in device and batch == -1:
+                batch = 16 * len(device.split(","))
+                logger.info(f"Using batch size {batch} for multi-GPU training")
+
+            if grad_checkpoint:
+                if "," in device:
+                    logger.warning("Gradient checkpointing is not supported for multi-GPU training")
+                else:
+                    logger.info("Enabling gradient checkpointing on backbone C2f blocks")
+                    model.add_callback("on_pretrain_routine_start", _install_gradient_checkpointing)
+                    model.add_callback("on_train_epoch_start", _enable_gradient_checkpointing)
+                    model.add_callback("on_train_epoch_end", _disable_gradient_checkpointing)
+
+            if cache is None:
+                cache = _select_train_cache(
+                    export_dir, imgsz=640, num_devices=len(device.split(","))
+                )
+
+            # Train model; batch=-1 lets Ultralytics' AutoBatch size the batch to
+            # the available GPU memory
+            logger.info(f"Starting training for {epochs} epochs with image size 640")
+            model.train(
+                data=data_yaml,
+                epochs=epochs,
+                imgsz=640,
+                batch=batch,
+                workers=workers,
+                cache=cache,
+                device=device,
+                amp=True,
+                name="finetuned",
+                project=PROJECT_ROOT,
+                exist_ok=True,
+            )
+
+            # train() returns the validator's metrics, which are None in the
+            # parent process of a multi-GPU run, so use the trainer instead
+            best_weights = os.path.join(model.trainer.save_dir, "weights", "best.pt")
+            logger.info(f"Training complete. Best weights saved to {best_weights}")
+        finally:
+            # Wait for the background load even if the export failed, so that
+            # the model it loads is released too. The future keeps its result
+            # alive, and Ultralytics' trainer, EMA and validator keep
+            # references to the weights, so drop them all explicitly
+            model_future.cancel()
+            wait([model_future])
+            del model, model_future
+            _release_cuda_memory()
 
         ctx.set_progress(
             progress=0.9, label="Training complete. Saving final weights..."
@@ -221,7 +1474,7 @@ class ModelFineTuner(foo.Operator):
 
         # Save trained weights to specified location
         logger.info(f"Copying weights to final destination: {export_uri}")
-        fos.copy_file(best_weights, export_uri)
+        _upload_file_parallel(best_weights, export_uri)
         logger.info(f"Successfully saved finetuned weights to {export_uri}")
 
         return {
@@ -231,6 +1484,64 @@ class ModelFineTuner(foo.Operator):
         }
 
 
+def _get_dataset_version(dataset) -> tuple:
+    """
+    Get a value that changes whenever a dataset's samples change.
+
+    Tagging updates the samples' ``last_modified_at``, and deletions change
+    the sample count. The count is read from the collection's metadata and
+    ``last_modified_at`` with an indexed query, so neither scans the
+    collection.
+
+    Args:
+        dataset: FiftyOne dataset
+
+    Returns:
+        tuple: (sample count, latest sample last_modified_at)
+    """
+    sample_collection = dataset._sample_collection
+    latest = sample_collection.find_one(
+        {}, {"last_modified_at": True}, sort=[("last_modified_at", -1)]
+    )
+    last_modified_at = latest.get("last_modified_at") if latest else None
+    return sample_collection.estimated_document_count(), last_modified_at
+
+
+@functools.lru_cache(maxsize=32)
+def _count_sample_tags(
+    dataset_name: str, group_slice: Optional[str], dataset_version: tuple
+) -> Dict[str, int]:
+    """
+    Count the samples with each tag in a dataset.
+
+    Results are memoized by dataset version, so repeated panel refreshes of
+    an unchanged dataset do not query the database again.
+
+    Args:
+        dataset_name: Name of the FiftyOne dataset
+        group_slice: Group slice to count, for grouped datasets, so that the
+            counts match the dataset's count_sample_tags()
+        dataset_version: Version returned by _get_dataset_version()
+
+    Returns:
+        dict: Mapping of tag to sample count
+    """
+    import fiftyone as fo
+
+    dataset = fo.load_dataset(dataset_name)
+    pipeline = []
+    if group_slice is not None:
+        group_path = dataset.group_field + ".name"
+        pipeline.append({"$match": {group_path: group_slice}})
+
+    pipeline.extend([
+        {"$unwind": "$tags"},
+        {"$group": {"_id": "$tags", "count": {"$sum": 1}}},
+    ])
+    cursor = dataset._sample_collection.aggregate(pipeline, allowDiskUse=True)
+    return {d["_id"]: d["count"] for d in cursor}
+
+
 class GetTagCounts(foo.Operator):
     """Operator to get tag counts for the dataset."""
 
@@ -253,13 +1564,20 @@ class GetTagCounts(foo.Operator):
         """
         dataset = ctx.dataset
         logger.info(f"Getting tag counts for dataset: {dataset.name}")
-        tag_counts = dataset.count_sample_tags()
-        logger.info(f"Tag counts: {tag_counts}")
+        group_slice = dataset.group_slice if dataset.media_type == "group" else None
+        tag_counts = dict(
+            _count_sample_tags(
+                dataset.name, group_slice, _get_dataset_version(dataset)
+            )
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Tag counts: {tag_counts}")
 
         result = {
             "tag_counts": tag_counts,
         }
-        logger.info(f"Returning result: {result}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Returning result: {result}")
         return result
 
 
@@ -284,37 +1602,63 @@ class ApplyRemoteModel(foo.Operator):
 
         Steps:
         1. Download model weights to local directory
-        2. Configure CUDA device
+        2. Load model onto CUDA device (cached across calls), optionally as
+           a TensorRT INT8 engine
         3. Apply model to dataset
 
         Returns:
             dict: Inference results including status
         """
-        from ultralytics import YOLO
-
         # Parse parameters
         det_field = ctx.params["det_field"]
         weights_path = ctx.params["weights_path"]
         target_device_index = ctx.params.get("target_device_index", 0)
+        int8 = ctx.params.get("int8", False)
+        compile_model = ctx.params.get("compile", False)
+        batch_size = ctx.params.get("batch_size", None)
+        num_workers = ctx.params.get("num_workers", min(8, os.cpu_count() or 1))
 
         logger.info(f"Starting model inference with parameters: det_field={det_field}, "
-                   f"device_index={target_device_index}")
+                   f"device_index={target_device_index}, int8={int8}")
         logger.info(f"Weights path: {weights_path}")
 
         dataset = ctx.dataset
-        logger.info(f"Applying model to dataset: {dataset.name} ({len(dataset)} samples)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Applying model to dataset: {dataset.name} ({dataset.count()} samples)")
 
         # Download model weights
         local_weights_path = _download_model_weights(weights_path)
 
+        if batch_size is None:
+            device, _ = _select_device(target_device_index)
+            batch_size = _select_inference_batch_size(device)
+
         # Initialize and configure model
-        logger.info(f"Loading YOLO model from {local_weights_path}")
-        model = YOLO(local_weights_path)
-        model, cuda_device_count = _setup_cuda_device(model, target_device_index)
+        model, cuda_device_count = _load_inference_model(
+            local_weights_path,
+            target_device_index,
+            calib_samples=dataset if int8 else None,
+            calib_dir=os.path.join(DATA_ROOT, dataset.name, "calibration"),
+            compile_model=compile_model,
+            batch_size=batch_size,
+        )
 
         # Apply model to dataset
-        logger.info(f"Applying model to dataset, predictions will be saved to field '{det_field}'")
-        ctx.dataset.apply_model(model, label_field=det_field)
+        logger.info(f"Applying model to dataset with batch size {batch_size} and "
+                   f"{num_workers} workers, predictions will be saved to field '{det_field}'")
+        try:
+            _apply_model_batched(
+                model,
+                ctx.dataset,
+                det_field,
+                batch_size=batch_size,
+                num_workers=num_workers,
+                ctx=ctx,
+            )
+        finally:
+            # The model itself stays in _MODEL_CACHE for later calls
+            del model
+            _release_cuda_memory()
         logger.info(f"Inference complete. Predictions saved to '{det_field}' field")
 
         return {